@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from purposepay.pagination import EstimatedCountPaginator
 from .models import CustomUser
 
 
@@ -14,9 +15,16 @@ class CustomUserAdmin(BaseUserAdmin):
     )
 
     list_filter = ("is_vendor", "is_customer", "is_staff", "is_active")
-    search_fields = ("email", "username")
+    # Boolean filters have fixed Yes/No choices; never run the per-choice count queries
+    show_facets = admin.ShowFacets.NEVER
+    # Left-anchored prefix search (LIKE 'term%') so the email/username indexes apply
+    search_fields = ("^email", "^username", "=id")
     ordering = ("email",)
 
+    list_per_page = 50
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     # Editing an existing user
     fieldsets = (
         (None, {"fields": ("email", "username", "password", "phone_number","profile_pic",)}),
@@ -0,0 +1,10 @@
+from django.urls import path
+from .views import LoginView, LogoutView
+
+# Auth routes only: login and logout, mounted under auth/
+app_name = 'auth'
+
+urlpatterns = [
+    path('login/', LoginView.as_view(), name='login'), # User login endpoint
+    path('logout/', LogoutView.as_view(), name='logout'), # User logout endpoint
+]
\ No newline at end of file
@@ -11,8 +11,14 @@ class EmailBackend(ModelBackend):
     """
     def authenticate(self, request, username=None, password=None, **kwargs):
         # login with email (username here is actually email)
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        # The token is joined in so LoginView does not need a second query for it
         try:
-            user = User.objects.get(email__iexact=username)
+            user = User.objects.select_related('auth_token').get(email__iexact=username)
         except User.DoesNotExist:
             return None
         
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-15 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_customuser_ci_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="is_customer",
+            field=models.BooleanField(
+                db_index=True,
+                default=True,
+                help_text="Designates whether this user is a Customer/Sender and can create vouchers.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="customuser",
+            name="is_vendor",
+            field=models.BooleanField(
+                db_index=True,
+                default=False,
+                help_text="Designates whether this user has a Vendor profile and can redeem vouchers.",
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@
 
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.db.models.functions import Lower
 
 
 
@@ -55,10 +56,10 @@ class CustomUser(AbstractUser):
 
 
     # PurposePay Role Flags (Defining the User Type)
-    is_vendor = models.BooleanField(default=False,
+    is_vendor = models.BooleanField(default=False, db_index=True,
                                     help_text='Designates whether this user has a Vendor profile and can redeem vouchers.')
     
-    is_customer = models.BooleanField(default=True,
+    is_customer = models.BooleanField(default=True, db_index=True,
         help_text='Designates whether this user is a Customer/Sender and can create vouchers.')
 
     profile_pic = models.ImageField(upload_to='profile_pics/',null=True,blank=True,help_text='Profile picture of the user.')
@@ -75,5 +76,13 @@ class CustomUser(AbstractUser):
         verbose_name = 'User'
         verbose_name_plural = 'Users'
 
+        # Case-insensitive uniqueness is enforced by the database. The unique
+        # LOWER() indexes also serve the case-insensitive email/username lookups
+        # (login, signup and profile update) instead of a full scan.
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='user_email_ci_unique'),
+            models.UniqueConstraint(Lower('username'), name='user_username_ci_unique'),
+        ]
+
 
 
@@ -2,17 +2,26 @@
 from rest_framework import serializers
 from .models import CustomUser
 from django.contrib.auth import authenticate
-from django.contrib.auth import get_user_model
+from django.contrib.auth.validators import UnicodeUsernameValidator
+import os
 import re
 
-User = get_user_model()
+# Ghanaian phone number format, compiled once at import
+_PHONE_RE = re.compile(r"^(?:\+233|0)\d{9}$")
+
+# Allowed profile picture extensions
+_ALLOWED_IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png'})
+
+# Leading bytes of JPEG and PNG files
+_IMG_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n')
 
 
 
 class RegisterSerializer(serializers.ModelSerializer):
     """
     Serializer for creating a new user (signup).
-    Validates unique email and optional role flags.
+    Validates optional role flags. Unique email and username are enforced
+    by the database constraints on CustomUser (see RegisterView).
     """
     password = serializers.CharField(write_only=True, min_length=6)
     username = serializers.CharField(required=True, max_length=15)
@@ -20,16 +29,10 @@ class RegisterSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = ['username', 'email', 'password', 'is_vendor', 'is_customer']
-
-    def validate_email(self, value):
-        if CustomUser.objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
-    
-    def validate_username(self, value):
-        if CustomUser.objects.filter(username__iexact=value).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
-        return value
+        extra_kwargs = {
+            # Uniqueness is checked by the database on save, not by an extra query
+            'email': {'validators': []},
+        }
     
 
     # Extra validation to ensure at least one role is selected and not both simultaneously
@@ -99,53 +102,46 @@ class UpdateUserSerializer(serializers.ModelSerializer):
         model = CustomUser
         fields = ['username', 'email', 'phone_number', 'profile_pic']
         extra_kwargs = {
-            'email': {'required': True}
+            # Uniqueness is checked by the database on save (see UserProfileView)
+            'email': {'required': True, 'validators': []},
+            'username': {'validators': [UnicodeUsernameValidator()]},
+            'phone_number': {'validators': []},
         }
-
-    def validate_email(self, value):
-        user = self.instance
-        if CustomUser.objects.filter(email__iexact=value).exclude(pk=user.pk).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
-    
-    def validate_username(self, value):
-        user = self.instance
-        if CustomUser.objects.filter(username__iexact=value).exclude(pk=user.pk).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
-        return value
     
     # Phone number validation for Ghanaian format
     def validate_phone_number(self, value):
-        pattern = r"^(?:\+233|0)\d{9}$"
-        if not re.match(pattern, value):
+        if not _PHONE_RE.match(value):
             raise serializers.ValidationError(
                 "Phone number must be in Ghanaian format."
             )
-        
-        # Check if phone number is used by another vendor
-        if User.objects.filter(phone_number=value).exclude(pk=self.instance.pk).exists():
-            raise serializers.ValidationError("This phone number is already in use by another user.")
-    
         return value 
     
     
     MAX_IMAGE_SIZE = 5 * 1024 * 1024 # 5MB
 
     def validate_profile_pic(self, value):
-        allowed = ('.jpg', '.jpeg', '.png')
-        if not value.name.lower().endswith(allowed):
-            raise serializers.ValidationError("Profile picture must be JPG or PNG.")
+        # Size is checked first so oversized uploads are rejected without reading them
         if value.size > self.MAX_IMAGE_SIZE:
             raise serializers.ValidationError("Image too large (max 5MB).")
+
+        ext = os.path.splitext(value.name)[1].lower()
+        if ext not in _ALLOWED_IMG_EXTS:
+            raise serializers.ValidationError("Profile picture must be JPG or PNG.")
+
+        # The file content must really be a JPEG or PNG, not just named like one
+        head = value.read(8)
+        value.seek(0)
+        if not head.startswith(_IMG_SIGNATURES):
+            raise serializers.ValidationError("Profile picture must be JPG or PNG.")
         return value
 
 
 
     # Update instance
     def update(self, instance, validated_data):
-        instance.username = validated_data.get('username', instance.username)
-        instance.email = validated_data.get('email', instance.email)
-        instance.phone_number = validated_data.get('phone_number', instance.phone_number)
-        instance.profile_pic = validated_data.get('profile_pic', instance.profile_pic)
-        instance.save()
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+
+        # Only write the columns that were sent in the request
+        instance.save(update_fields=list(validated_data))
         return instance
\ No newline at end of file
@@ -5,19 +5,57 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
 from django.contrib.auth import logout, get_user_model
+from django.db import IntegrityError
 
 from .serializers import RegisterSerializer, LoginSerializer, UserSerializer, UpdateUserSerializer
 
 User = get_user_model()
 
 
+# Unique index/constraint names on CustomUser mapped to the field and error message
+# returned to the client when the database rejects a duplicate value.
+UNIQUE_FIELD_ERRORS = {
+    'email': (
+        ('user_email_ci_unique', 'customuser.email', 'customuser_email_key'),
+        "A user with this email already exists.",
+    ),
+    'username': (
+        ('user_username_ci_unique', 'customuser.username', 'customuser_username_key'),
+        "A user with this username already exists.",
+    ),
+    'phone_number': (
+        ('customuser.phone_number', 'customuser_phone_number_key'),
+        "This phone number is already in use by another user.",
+    ),
+}
+
+
+def save_unique_user(serializer, **kwargs):
+    """
+    Save the serializer and turn a unique constraint violation into a 400 response
+    with the same message the old pre-save existence checks returned.
+    """
+    try:
+        return serializer.save(**kwargs)
+    except IntegrityError as exc:
+        message = str(exc)
+        for field, (names, error) in UNIQUE_FIELD_ERRORS.items():
+            if any(name in message for name in names):
+                raise ValidationError({field: [error]})
+        raise
+
+
 class RegisterView(generics.CreateAPIView):
     """POST /account/register/ - create a new user"""
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
 
+    def perform_create(self, serializer):
+        save_unique_user(serializer)
+
 
 class LoginView(APIView):
     """POST /auth/login/ - authenticate user and return token"""
@@ -28,8 +66,11 @@ class LoginView(APIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data['user']
 
-        # Explicit token creation (safe even if signals fail)
-        token, _ = Token.objects.get_or_create(user=user)
+        # The backend joins the token in; only create one if it is missing
+        # (safe even if signals fail)
+        token = getattr(user, 'auth_token', None)
+        if token is None:
+            token, _ = Token.objects.get_or_create(user=user)
         user_data = UserSerializer(user, context={"request": request}).data
 
         return Response({
@@ -46,7 +87,8 @@ class LogoutView(APIView):
 
     def post(self, request):
         try:
-            request.user.auth_token.delete()
+            # TokenAuthentication already loaded the token as request.auth
+            request.auth.delete()
         except Exception:
             pass
         logout(request)
@@ -66,6 +108,9 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     def get_object(self):
         return self.request.user
 
+    def perform_update(self, serializer):
+        save_unique_user(serializer)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         # Add dynamic welcome message to serializer context
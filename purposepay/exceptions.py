@@ -0,0 +1,23 @@
+# purposepay/exceptions.py
+
+from django.core.exceptions import RequestDataTooBig
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler
+
+
+class RequestTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Upload exceeds the maximum allowed request size."
+    default_code = "request_too_large"
+
+
+def api_exception_handler(exc, context):
+    """
+    DRF's exception handler, plus RequestDataTooBig from the upload size limit.
+    Django treats it as a SuspiciousOperation and would answer with an HTML 400
+    page, so API clients get a JSON 413 {"detail": ...} like other API errors.
+    """
+    if isinstance(exc, RequestDataTooBig):
+        exc = RequestTooLarge()
+    return exception_handler(exc, context)
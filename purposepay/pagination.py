@@ -0,0 +1,114 @@
+# purposepay/pagination.py
+
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+def estimated_row_count(queryset):
+    """
+    Return the row estimate the database keeps for the queryset's table,
+    or None when the backend does not expose one.
+    """
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+
+    if connection.vendor == 'postgresql':
+        sql = "SELECT reltuples FROM pg_class WHERE relname = %s"
+    elif connection.vendor == 'mysql':
+        sql = ("SELECT table_rows FROM information_schema.tables "
+               "WHERE table_schema = DATABASE() AND table_name = %s")
+    else:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+
+    if row is None or row[0] is None:
+        return None
+    return int(row[0])
+
+
+class EstimatedPage(Page):
+    """
+    Page of an EstimatedCountPaginator whose bounds come from the rows it
+    actually holds rather than from the estimated count.
+    """
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin change-list paginator that uses the table row estimate instead of
+    running SELECT COUNT(*) over the whole table.
+    Filtered change lists and small tables still get an exact count.
+
+    The estimate is only reported as the total. It never decides which pages
+    exist: any page that holds rows is served, even past the estimated last page.
+    """
+
+    # Below this many rows an exact COUNT(*) is cheap enough
+    ESTIMATE_THRESHOLD = 10000
+
+    @cached_property
+    def estimated_count(self):
+        """The table row estimate when it is used as the count, otherwise None."""
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset)
+            if estimate is not None and estimate > self.ESTIMATE_THRESHOLD:
+                return estimate
+        return None
+
+    @cached_property
+    def count(self):
+        if self.estimated_count is not None:
+            return self.estimated_count
+        return super().count
+
+    def validate_number(self, number):
+        if self.estimated_count is None:
+            return super().validate_number(number)
+
+        # Only the lower bound is checked here, page() finds out whether rows exist
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if self.estimated_count is None:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # One extra row tells whether a next page exists, whatever the estimate says
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedPage(rows[:self.per_page], number, self, has_more=len(rows) > self.per_page)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    API pagination for admin lists over large tables.
+    Unfiltered lists take their total from the table row estimate, see EstimatedCountPaginator.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
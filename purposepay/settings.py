@@ -154,6 +154,35 @@ STATICFILES_DIRS = [
 ]
 
 
+# Uploads over 1MB are streamed to a temporary file instead of held in memory
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1 * 1024 * 1024
+
+# Largest multipart request accepted, vendor signup carries up to 10 + 10 + 5MB of documents
+MAX_UPLOAD_REQUEST_SIZE = config('MAX_UPLOAD_REQUEST_SIZE', default=26 * 1024 * 1024, cast=int)
+
+FILE_UPLOAD_HANDLERS = [
+    "purposepay.uploads.MaxRequestSizeUploadHandler",
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
+
+# Rows per INSERT when bulk loading vendors (VendorProfile.bulk_ingest)
+VENDOR_BULK_BATCH_SIZE = config('VENDOR_BULK_BATCH_SIZE', default=500, cast=int)
+
+
+# Cache (local memory by default, e.g. django.core.cache.backends.redis.RedisCache in production)
+CACHES = {
+    "default": {
+        "BACKEND": config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        "LOCATION": config('CACHE_LOCATION', default='purposepay'),
+    }
+}
+
+# Seconds the public vendor directory is cached for
+VENDOR_PUBLIC_CACHE_TIMEOUT = config('VENDOR_PUBLIC_CACHE_TIMEOUT', default=300, cast=int)
+
+
 # Rest Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
@@ -169,4 +198,10 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # Oversized uploads are answered with a JSON 413 instead of Django's HTML 400
+    "EXCEPTION_HANDLER": "purposepay.exceptions.api_exception_handler",
+    # Browsable API pages are only rendered in development
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+    ] + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
 }
@@ -0,0 +1,24 @@
+# purposepay/uploads.py
+
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class MaxRequestSizeUploadHandler(FileUploadHandler):
+    """
+    Reject multipart requests larger than MAX_UPLOAD_REQUEST_SIZE from the
+    Content-Length header, before any of the body is read or buffered.
+    Files are left to the memory/temporary file handlers after it. API clients
+    receive a 413 with a JSON {"detail": ...} body (see purposepay.exceptions).
+    """
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length > settings.MAX_UPLOAD_REQUEST_SIZE:
+            raise RequestDataTooBig("Upload exceeds the maximum allowed request size.")
+
+    def receive_data_chunk(self, raw_data, start):
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
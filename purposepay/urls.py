@@ -30,7 +30,7 @@ urlpatterns = [
 
     # Auth routes: only login/logout
     # Using namespace 'auth' for reverse lookups: auth:login, auth:logout
-    path('auth/', include(('accounts.urls', 'accounts'), namespace='auth')),
+    path('auth/', include(('accounts.auth_urls', 'auth'), namespace='auth')),
 
     # Account routes: registration, profile, etc.
     # Namespace 'accounts' for reverse lookups: accounts:register, accounts:profile
@@ -47,11 +47,14 @@ urlpatterns = [
 
 
 
-# Serving static files for vendor-related documents
-urlpatterns += [
-      re_path(r'^profile_pics/(?P<path>.*)$', serve, {'document_root': settings.PROFILE_PIC_DIR}),
-    re_path(r'^vendor_ids/(?P<path>.*)$', serve, {'document_root': settings.VENDOR_ID_DIR}),
-    re_path(r'^vendor_certificates/(?P<path>.*)$', serve, {'document_root': settings.VENDOR_CERT_DIR}),
-    re_path(r'^vendor_locations/(?P<path>.*)$', serve, {'document_root': settings.VENDOR_LOCATION_DIR}),
-]
+# Serving uploaded files for profile pictures and vendor-related documents.
+# Only in development: django.views.static.serve copies every byte through Python,
+# in production the web server serves these directories directly (see README).
+if settings.DEBUG:
+    urlpatterns += [
+        re_path(r'^profile_pics/(?P<path>.*)$', serve, {'document_root': settings.PROFILE_PIC_DIR}),
+        re_path(r'^vendor_ids/(?P<path>.*)$', serve, {'document_root': settings.VENDOR_ID_DIR}),
+        re_path(r'^vendor_certificates/(?P<path>.*)$', serve, {'document_root': settings.VENDOR_CERT_DIR}),
+        re_path(r'^vendor_locations/(?P<path>.*)$', serve, {'document_root': settings.VENDOR_LOCATION_DIR}),
+    ]
 
@@ -15,6 +15,9 @@ class VoucherAdmin(admin.ModelAdmin):
 
     readonly_fields = ("code","remaining_balance","created_at",)
 
+    # Search customers over AJAX instead of rendering every user in a <select>
+    autocomplete_fields = ("customer",)
+
 
 # Register VoucherRedemption model in admin
 @admin.register(VoucherRedemption)
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-15 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("voucher", "0005_voucher_escrow_balance_alter_voucher_status_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="voucher",
+            name="category",
+            field=models.CharField(
+                choices=[
+                    ("PHARMACY", "Pharmacy"),
+                    ("SCHOOL", "School"),
+                    ("HARDWARE", "Hardware Store"),
+                    ("OTHER", "Other"),
+                ],
+                help_text="Redeemable by vendors in this category",
+                max_length=20,
+            ),
+        ),
+    ]
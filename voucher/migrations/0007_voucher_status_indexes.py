@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-15 20:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vendor", "0007_narrow_choice_columns"),
+        ("voucher", "0006_narrow_category_column"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="voucher",
+            index=models.Index(
+                fields=["status", "category"], name="voucher_status_category_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="voucherredemption",
+            index=models.Index(
+                fields=["voucher", "redemption_status"],
+                name="redemption_voucher_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-15 20:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("voucher", "0007_voucher_status_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="voucher",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("remaining_balance__gte", 0)),
+                name="voucher_remaining_balance_nonneg",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="voucher",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("escrow_balance__gte", 0)),
+                name="voucher_escrow_balance_nonneg",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-15 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vendor", "0007_narrow_choice_columns"),
+        ("voucher", "0008_voucher_balance_nonneg"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="voucherredemption",
+            index=models.Index(
+                fields=["vendor", "-redeemed_at"], name="redemption_vendor_recent_idx"
+            ),
+        ),
+    ]
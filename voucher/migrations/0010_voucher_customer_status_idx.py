@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-15 20:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("voucher", "0009_redemption_vendor_recent_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="voucher",
+            index=models.Index(
+                fields=["customer", "status"], name="voucher_customer_status_idx"
+            ),
+        ),
+    ]
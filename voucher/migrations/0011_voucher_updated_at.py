@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-15 20:27
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("voucher", "0010_voucher_customer_status_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="voucher",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="voucher",
+            index=models.Index(
+                fields=["customer", "updated_at"], name="voucher_customer_updated_idx"
+            ),
+        ),
+    ]
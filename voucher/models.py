@@ -9,12 +9,20 @@ from vendor.models import VendorProfile
 from decimal import Decimal
 
 
+# Voucher code alphabet and length (after the PP- prefix)
+CODE_CHARACTERS = string.ascii_uppercase + string.digits
+CODE_LENGTH = 11
+
+
 def generate_voucher_code():
     """Generate a unique voucher code with the purposepay prefix as PP."""
-    characters = string.ascii_uppercase + string.digits
-    code_length = 11
-    unique_part = ''.join(secrets.choice(characters) for _ in range(code_length))
-    return f"PP-{unique_part}"
+    # One CSPRNG draw covers every character, uniform over the same 36^11 codes
+    number = secrets.randbelow(len(CODE_CHARACTERS) ** CODE_LENGTH)
+    unique_part = []
+    for _ in range(CODE_LENGTH):
+        number, index = divmod(number, len(CODE_CHARACTERS))
+        unique_part.append(CODE_CHARACTERS[index])
+    return f"PP-{''.join(unique_part)}"
 
 
 def default_expiry():
@@ -43,7 +51,7 @@ class Voucher(models.Model):
     code = models.CharField(max_length=14, unique=True, default=generate_voucher_code, db_index=True)
 
     category = models.CharField(
-        max_length=50, choices=VendorProfile.CATEGORY_CHOICES, help_text="Redeemable by vendors in this category"
+        max_length=20, choices=VendorProfile.CATEGORY_CHOICES, help_text="Redeemable by vendors in this category"
     )
     initial_amount = models.DecimalField(max_digits=12, decimal_places=2)
     
@@ -61,6 +69,9 @@ class Voucher(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Bumped on every change, queryset updates set it explicitly
+    updated_at = models.DateTimeField(auto_now=True)
+
     def save(self, *args, **kwargs):
         # The remaining balance is set to the initial amount on creation
         if not self.pk:
@@ -73,6 +84,22 @@ class Voucher(models.Model):
     def __str__(self):
         return f"{self.code} ({self.status})"
 
+    class Meta:
+        indexes = [
+            # Admin voucher list filters by status and category
+            models.Index(fields=['status', 'category'], name='voucher_status_category_idx'),
+            # Customers list their own vouchers, optionally by status
+            models.Index(fields=['customer', 'status'], name='voucher_customer_status_idx'),
+            # Latest change to a customer's vouchers, used for conditional GETs on their list
+            models.Index(fields=['customer', 'updated_at'], name='voucher_customer_updated_idx'),
+        ]
+
+        # Redemptions can never take a voucher below zero
+        constraints = [
+            models.CheckConstraint(condition=models.Q(remaining_balance__gte=0), name='voucher_remaining_balance_nonneg'),
+            models.CheckConstraint(condition=models.Q(escrow_balance__gte=0), name='voucher_escrow_balance_nonneg'),
+        ]
+
 
 
 class VoucherRedemption(models.Model):
@@ -106,6 +133,13 @@ class VoucherRedemption(models.Model):
         verbose_name = "Voucher Redemption"
         verbose_name_plural = "Voucher Redemptions"
 
+        indexes = [
+            # Pending redemptions of a voucher are looked up and cancelled together
+            models.Index(fields=['voucher', 'redemption_status'], name='redemption_voucher_status_idx'),
+            # Vendor redemption history is listed newest first, page by page
+            models.Index(fields=['vendor', '-redeemed_at'], name='redemption_vendor_recent_idx'),
+        ]
+
     def __str__(self):
         return f"{self.voucher.code} redeemed by {self.vendor.business_name}"
     
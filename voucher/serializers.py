@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 from django.db import transaction
+from django.db.models import F, Q
 from django.utils import timezone
 from rest_framework import serializers
 import voucher
@@ -36,11 +37,11 @@ class WalletDepositSerializer(serializers.Serializer):
         wallet = self.context["wallet"]
         amount = self.validated_data["amount"]
 
-        # Perform atomic and row-level locked update to prevent race conditions
+        # Add to the balance in the database, so concurrent deposits cannot overwrite each other.
+        # The new balance is read back in the same transaction for the response.
         with transaction.atomic():
-            wallet = CustomerVoucherWallet.objects.select_for_update().get(pk=wallet.pk)
-            wallet.balance += amount
-            wallet.save(update_fields=["balance"])
+            CustomerVoucherWallet.objects.filter(pk=wallet.pk).update(balance=F("balance") + amount)
+            wallet.refresh_from_db(fields=["balance"])
         return wallet
 
 
@@ -80,17 +81,14 @@ class VoucherCreateSerializer(serializers.ModelSerializer):
 
         # Atomic operation to deduct wallet balance and create voucher
         with transaction.atomic():
-            wallet, _ = CustomerVoucherWallet.objects.select_for_update().get_or_create(
-                customer=customer,defaults={"balance": Decimal("0.00")})
+            # Subtract the amount from the wallet in one UPDATE, only if the balance covers it.
+            # A customer without a wallet has no balance either, so nothing is updated.
+            debited = CustomerVoucherWallet.objects.filter(customer=customer, balance__gte=amount).update(
+                balance=F("balance") - amount)
 
-
-            if wallet.balance < amount:
+            if not debited:
                 raise serializers.ValidationError("Insufficient wallet balance to create this voucher.")
 
-            # Subtract the amount from the wallet
-            wallet.balance -= amount
-            wallet.save(update_fields=["balance"])
-
             # The voucher is created with status=PENDING
             voucher = Voucher.objects.create(customer=customer, status=Voucher.PENDING, **validated_data)
 
@@ -112,11 +110,25 @@ class CustomerVoucherSerializer(serializers.ModelSerializer):
 
 
 
+class VoucherRedemptionSerializer(serializers.ModelSerializer):
+    """"" Serializer to display voucher redemption records (read-only)."""""
+
+    vendor_name = serializers.ReadOnlyField(source="vendor.business_name")
+    voucher_code = serializers.ReadOnlyField(source="voucher.code")
+    voucher_owner = serializers.ReadOnlyField(source="voucher.customer.username")
+
+    class Meta:
+        model = VoucherRedemption
+        fields = ["id", "voucher_owner","voucher_code", "vendor_name", "redeemed_amount", "redeemed_at","redemption_status"]
+        read_only_fields = fields
+
+
 class CustomerVoucherDetailSerializer(serializers.ModelSerializer):
     """"" Shows the detailed information of a single customer's voucher, read-only."""""
 
     customer_username = serializers.ReadOnlyField(source="customer.username")
-    redemptions = serializers.SerializerMethodField()
+    # Prefetched newest first by the view
+    redemptions = VoucherRedemptionSerializer(many=True, read_only=True)
 
     class Meta:
         model = Voucher
@@ -126,8 +138,6 @@ class CustomerVoucherDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
-    def get_redemptions(self, obj):
-        return VoucherRedemptionSerializer(obj.redemptions.all().order_by("-redeemed_at"), many=True).data
 
 
 
@@ -136,6 +146,47 @@ class CustomerVoucherDetailSerializer(serializers.ModelSerializer):
 # Voucher Redemption serializers
 # ------------------------------
 
+class VoucherRedemptionBatchSerializer(serializers.ListSerializer):
+    """
+    Validates a batch of vendor redemption requests.
+    All voucher codes in the batch are looked up in one query before the items are validated.
+    """
+
+    @staticmethod
+    def vouchers_by_code(codes):
+        """
+        Vouchers for the given codes, keyed by upper case code.
+        Codes are generated in upper case, so the codes are upper cased before the query
+        and match the same way whatever the database collation.
+        """
+        codes = {code.upper() for code in codes if isinstance(code, str)}
+        return {voucher.code.upper(): voucher for voucher in Voucher.objects.filter(code__in=codes)}
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.context["vouchers"] = self.vouchers_by_code(
+                item.get("voucher_code") for item in data if isinstance(item, dict))
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        # Each item is only checked against the balance on its own, so items for the same
+        # voucher must not add up to more than the voucher has left
+        totals = {}
+        for item in attrs:
+            voucher = item["voucher"]
+            totals[voucher.code] = totals.get(voucher.code, Decimal("0.00")) + item["redeemed_amount"]
+            if totals[voucher.code] > voucher.remaining_balance:
+                raise serializers.ValidationError(
+                    f"Redemptions for voucher {voucher.code} exceed its remaining balance."
+                )
+        return attrs
+
+    def create(self, validated_data):
+        # All redemptions in the batch are created or none are
+        with transaction.atomic():
+            return super().create(validated_data)
+
+
 class VoucherRedemptionCreateSerializer(serializers.ModelSerializer):
     """""
     Serializer for vendors to request voucher redemption.
@@ -154,6 +205,7 @@ class VoucherRedemptionCreateSerializer(serializers.ModelSerializer):
             "redeemed_amount", "redemption_status", "redeemed_at", "voucher_category"
         ]
         read_only_fields = ["id", "vendor_name", "redeemed_at", "voucher_category", "redemption_status"]
+        list_serializer_class = VoucherRedemptionBatchSerializer
 
 
     # Validation of voucher code and redemption amount
@@ -165,9 +217,12 @@ class VoucherRedemptionCreateSerializer(serializers.ModelSerializer):
         #--------------------
         # Voucher validation
         #--------------------
-        try:
-            voucher = Voucher.objects.get(code=code)
-        except Voucher.DoesNotExist:
+        # Batch requests resolve every code up front, single requests use the same lookup for one code
+        vouchers = self.context.get("vouchers")
+        if vouchers is None:
+            vouchers = VoucherRedemptionBatchSerializer.vouchers_by_code([code])
+        voucher = vouchers.get(code.upper())
+        if voucher is None:
             raise serializers.ValidationError("Invalid voucher code.")
 
         
@@ -257,70 +312,60 @@ class VoucherRedemptionConfirmSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         amount = instance.redeemed_amount
 
-        with transaction.atomic():
-            instance = (VoucherRedemption.objects.select_for_update().select_related("voucher", "vendor__finance")
-                        .get(pk=instance.pk))
-
+        # The view has already locked the redemption, its voucher and the vendor finance row.
+        # Any error here rolls back its transaction as a whole, so no savepoint is needed.
+        with transaction.atomic(savepoint=False):
             voucher = instance.voucher
             vendor = instance.vendor
 
             # Vendor finance record must exist before crediting
-            if not hasattr(vendor, "finance"):
+            try:
+                finance = vendor.finance
+            except VendorFinance.DoesNotExist:
                 raise serializers.ValidationError("Vendor finance record not found.")
 
             # Perform final checks before confirming redemption
             if instance.redemption_status == VoucherRedemption.REDEEMED:
                 raise serializers.ValidationError("This redemption is already redeemed.")
 
-            # Escrow balance check before finalizing (the money source)
-            if amount > voucher.escrow_balance:
-                raise serializers.ValidationError("Insufficient escrow balance to confirm this redemption.")
-
-            # Check remaining balance too
-            if amount > voucher.remaining_balance:
-                raise serializers.ValidationError("Insufficient voucher remaining balance.")
-
-            # Only finalize voucher redemption after customer confirms
-            instance.redemption_status = VoucherRedemption.REDEEMED
-            instance.save(update_fields=["redemption_status"])
-
-            # Deduct from voucher escrow balance and credit vendor finance balance
-            voucher.escrow_balance -= amount
-            vendor.finance.balance += amount
-
-            # update voucher remaining balance
-            voucher.remaining_balance -= amount
-
-            # If voucher balance is zero or less, lock the voucher
-            if voucher.remaining_balance <= 0:
-                voucher.remaining_balance = 0
-                voucher.status = Voucher.LOCKED
-
+            # Deduct from voucher escrow and remaining balance
+            changes = {
+                "escrow_balance": F("escrow_balance") - amount,
+                "remaining_balance": F("remaining_balance") - amount,
+                "updated_at": timezone.now(),
+            }
+
+            # If voucher balance is used up, lock the voucher
+            voucher_used_up = voucher.remaining_balance - amount <= 0
+            if voucher_used_up:
+                changes["status"] = Voucher.LOCKED
+
+            # The voucher must still be active, unexpired and funded (escrow is the money source).
+            # These checks are part of the UPDATE itself, so the debit and its conditions are one statement.
+            updated = Voucher.objects.filter(
+                Q(expiry_date__isnull=True) | Q(expiry_date__gt=timezone.now()),
+                pk=voucher.pk, status=Voucher.ACTIVE,
+                escrow_balance__gte=amount, remaining_balance__gte=amount,
+            ).update(**changes)
+            if not updated:
+                raise serializers.ValidationError("Voucher is no longer available for this redemption.")
+
+            if voucher_used_up:
                 # Other pending redemptions will be cancelled, as no more funds are available
                 VoucherRedemption.objects.filter(
                     voucher=voucher,
                     redemption_status=VoucherRedemption.PENDING
                 ).exclude(id=instance.id).update(redemption_status=VoucherRedemption.CANCELLED)
 
-            # Save all the changes made
-            voucher.save(update_fields=["escrow_balance", "remaining_balance", "status"])
-            vendor.finance.save(update_fields=["balance"])
-
-        return instance
-
-
+            # Only finalize voucher redemption after customer confirms
+            instance.redemption_status = VoucherRedemption.REDEEMED
+            instance.save(update_fields=["redemption_status"])
 
-class VoucherRedemptionSerializer(serializers.ModelSerializer):
-    """"" Serializer to display voucher redemption records (read-only)."""""
+            # Credit the vendor in a single UPDATE, no read-modify-write on the balance
+            VendorFinance.objects.filter(pk=finance.pk).update(balance=F("balance") + amount)
 
-    vendor_name = serializers.ReadOnlyField(source="vendor.business_name")
-    voucher_code = serializers.ReadOnlyField(source="voucher.code")
-    voucher_owner = serializers.ReadOnlyField(source="voucher.customer.username")
+        return instance
 
-    class Meta:
-        model = VoucherRedemption
-        fields = ["id", "voucher_owner","voucher_code", "vendor_name", "redeemed_amount", "redeemed_at","redemption_status"]
-        read_only_fields = fields
 
 
 class VendorRedemptionHistorySerializer(serializers.ModelSerializer):
@@ -342,7 +387,8 @@ class AdminVoucherListSerializer(serializers.ModelSerializer):
     """""A serializer to give an overview of all vouchers created by the customer."""
 
     customer_username = serializers.ReadOnlyField(source="customer.username")
-    redemptions_count = serializers.SerializerMethodField()
+    # Annotated on the queryset by AdminVoucherListView
+    redemptions_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Voucher
@@ -350,14 +396,12 @@ class AdminVoucherListSerializer(serializers.ModelSerializer):
                   "status", "expiry_date", "created_at", "redemptions_count"]
         read_only_fields = fields
 
-    def get_redemptions_count(self, obj):
-        return obj.redemptions.count()
-
 
 class AdminVoucherDetailSerializer(serializers.ModelSerializer):
     """"" Admin detailed view of a voucher including all redemptions."""""
     customer_username = serializers.ReadOnlyField(source="customer.username")
-    redemptions = serializers.SerializerMethodField()
+    # Prefetched newest first by the view
+    redemptions = VoucherRedemptionSerializer(many=True, read_only=True)
 
     class Meta:
         model = Voucher
@@ -365,5 +409,3 @@ class AdminVoucherDetailSerializer(serializers.ModelSerializer):
                   "status", "expiry_date", "created_at", "redemptions"]
         read_only_fields = fields
 
-    def get_redemptions(self, obj):
-        return VoucherRedemptionSerializer(obj.redemptions.all().order_by("-redeemed_at"), many=True).data
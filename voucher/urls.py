@@ -1,9 +1,9 @@
 from django.urls import path
 from .views import (
     VoucherCreateView, CustomerVoucherListView, CustomerVoucherDetailView,
-    VoucherRedemptionCreateView, VendorRedemptionHistoryView,
+    VoucherRedemptionCreateView, VoucherRedemptionBatchCreateView, VendorRedemptionHistoryView,
     CustomerPendingRedemptionListView, VoucherRedemptionConfirmView,VoucherRedemptionCancelView,
-    AdminVoucherListView, AdminVoucherDetailView,
+    AdminVoucherListView, AdminVoucherDetailView, AdminVoucherExportView,
     VoucherActivateSimulationView, ApprovedVendorsListView, CustomerVoucherWalletView, WalletDepositView
 )
 
@@ -26,6 +26,7 @@ urlpatterns = [
 
     # Vendor Redemptions
     path('vendor/redemptions/create/', VoucherRedemptionCreateView.as_view(), name='voucher-redemption-create'),
+    path('vendor/redemptions/batch/', VoucherRedemptionBatchCreateView.as_view(), name='voucher-redemption-batch-create'),
     path('vendor/redemptions/history/', VendorRedemptionHistoryView.as_view(), name='vendor-redemption-history'),
 
     # Customer Pending Redemptions
@@ -35,5 +36,6 @@ urlpatterns = [
 
     # Admin Voucher Views
     path('admin/vouchers/', AdminVoucherListView.as_view(), name='admin-voucher-list'),
+    path('admin/vouchers/export/', AdminVoucherExportView.as_view(), name='admin-voucher-export'),
     path('admin/vouchers/<int:id>/', AdminVoucherDetailView.as_view(), name='admin-voucher-detail'),
 ]
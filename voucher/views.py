@@ -1,6 +1,7 @@
 # voucher/views.py
 
 from rest_framework import generics, status
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
@@ -14,8 +15,39 @@ from .serializers import (
 from .permissions import IsCustomer
 from vendor.models import VendorProfile, VendorVerification
 from vendor.permissions import IsApprovedVendor
+from vendor.views import version_stamp
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Count, F, Max, Prefetch
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from purposepay.pagination import EstimatedCountPagination
+from urllib.parse import quote
+import json
+
+
+# Columns rendered by CustomerVoucherSerializer and AdminVoucherListSerializer
+VOUCHER_LIST_FIELDS = (
+    "id", "code", "category", "initial_amount", "remaining_balance",
+    "status", "expiry_date", "created_at", "customer__username",
+)
+
+# Columns rendered by CustomerPendingRedemptionSerializer and VendorRedemptionHistorySerializer
+REDEMPTION_LIST_FIELDS = ("id", "redeemed_amount", "redemption_status", "redeemed_at", "voucher__code")
+
+
+def voucher_detail_queryset():
+    """Vouchers with their owner joined and redemptions prefetched newest first."""
+    redemptions = VoucherRedemption.objects.select_related("vendor").order_by("-redeemed_at")
+    return Voucher.objects.select_related("customer").prefetch_related(
+        Prefetch("redemptions", queryset=redemptions)
+    )
 
 
 
@@ -30,6 +62,9 @@ class CustomerVoucherWalletView(generics.RetrieveAPIView):
     def get_object(self):
         # Get or create the wallet of the logged-in customer
         wallet, _ = CustomerVoucherWallet.objects.get_or_create(customer=self.request.user)
+
+        # The serializer reads customer.username, reuse the authenticated user instead of fetching it again
+        wallet.customer = self.request.user
         return wallet
 
 class WalletDepositView(generics.GenericAPIView):
@@ -72,7 +107,25 @@ class CustomerVoucherListView(generics.ListAPIView):
     ordering = ["-created_at"]
 
     def get_queryset(self):
-        return Voucher.objects.filter(customer=self.request.user)
+        return Voucher.objects.select_related("customer").only(*VOUCHER_LIST_FIELDS).filter(customer=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        # The page only changes when one of the customer's vouchers or their username (shown on
+        # every voucher) does, so clients revalidate by ETag
+        stamp = self.filter_queryset(self.get_queryset()).aggregate(
+            last_updated=Max("updated_at"), total=Count("id"))
+        etag = quote_etag(f"vouchers-{request.user.id}-{quote(request.user.username)}-"
+                          f"{version_stamp(stamp['last_updated'])}-{stamp['total']}")
+
+        # Client already has this version of the list
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
 
 class CustomerVoucherDetailView(generics.RetrieveAPIView):
@@ -83,7 +136,7 @@ class CustomerVoucherDetailView(generics.RetrieveAPIView):
     lookup_field = 'id'
 
     def get_queryset(self):
-        return Voucher.objects.filter(customer=self.request.user)
+        return voucher_detail_queryset().filter(customer=self.request.user)
 
 
 
@@ -102,6 +155,17 @@ class VoucherRedemptionCreateView(generics.CreateAPIView):
         context['vendor_profile'] = self.request.user.vendor_profile
         return context
 
+
+class VoucherRedemptionBatchCreateView(VoucherRedemptionCreateView):
+    """Vendor requests several voucher redemptions at once, each one is created as PENDING."""
+
+    # Largest number of redemptions accepted in a single request
+    max_batch_size = 50
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.update(many=True, allow_empty=False, max_length=self.max_batch_size)
+        return super().get_serializer(*args, **kwargs)
+
 class VendorRedemptionHistoryView(generics.ListAPIView):
     """Vendor sees all confirmed redemption history."""
     serializer_class = VendorRedemptionHistorySerializer
@@ -117,7 +181,7 @@ class VendorRedemptionHistoryView(generics.ListAPIView):
         # Get the vendor profile of the logged-in user
         user = self.request.user
         vendor = user.vendor_profile
-        return VoucherRedemption.objects.filter(vendor=vendor)
+        return VoucherRedemption.objects.select_related("voucher").only(*REDEMPTION_LIST_FIELDS).filter(vendor=vendor)
 
 
 
@@ -131,24 +195,37 @@ class CustomerPendingRedemptionListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsCustomer]
 
     def get_queryset(self):
-        return VoucherRedemption.objects.filter(
+        return VoucherRedemption.objects.select_related("vendor", "voucher").only(
+            *REDEMPTION_LIST_FIELDS, "vendor__business_name", "voucher__category"
+        ).filter(
         voucher__customer=self.request.user,
         redemption_status=VoucherRedemption.PENDING).order_by("-redeemed_at")
 
 
 class VoucherRedemptionCancelView(generics.UpdateAPIView):
     """Customer cancels a pending voucher redemption."""
+    # Describes the redemption for OPTIONS requests, the cancellation itself takes no input
+    serializer_class = CustomerPendingRedemptionSerializer
     permission_classes = [IsAuthenticated, IsCustomer]
     lookup_field = 'id'
 
     def get_queryset(self):
+        # Not used by update(), but get_object() still needs it for OPTIONS requests
         return VoucherRedemption.objects.filter(voucher__customer=self.request.user, redemption_status=VoucherRedemption.PENDING)
 
     def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.redemption_status = VoucherRedemption.CANCELLED
-        instance.save(update_fields=["redemption_status"])
-        return Response({"detail": "The voucher redemption is cancelled.", "redemption_status": instance.redemption_status})
+        # Ownership, the PENDING check and the status change are a single UPDATE, so a redemption
+        # confirmed at the same moment is not cancelled as well. Ownership is a subquery on the
+        # voucher table rather than a join, which MySQL would turn into a separate SELECT.
+        customer_vouchers = Voucher.objects.filter(customer=request.user).values("id")
+        cancelled = VoucherRedemption.objects.filter(
+            id=kwargs[self.lookup_field], voucher_id__in=customer_vouchers,
+            redemption_status=VoucherRedemption.PENDING,
+        ).update(redemption_status=VoucherRedemption.CANCELLED)
+
+        if not cancelled:
+            raise NotFound("No pending redemption matches the given query.")
+        return Response({"detail": "The voucher redemption is cancelled.", "redemption_status": VoucherRedemption.CANCELLED})
 
 
 class VoucherRedemptionConfirmView(generics.UpdateAPIView):
@@ -161,8 +238,19 @@ class VoucherRedemptionConfirmView(generics.UpdateAPIView):
     lookup_field = "id"
 
     def get_queryset(self):
-        return VoucherRedemption.objects.filter(voucher__customer=self.request.user,
-            redemption_status=VoucherRedemption.PENDING)
+        queryset = VoucherRedemption.objects.select_related("voucher", "vendor__finance").filter(
+            voucher__customer=self.request.user, redemption_status=VoucherRedemption.PENDING)
+        # Inside update() the redemption is locked with its voucher and the vendor finance row it
+        # credits, so the serializer validates and updates the same rows without fetching them again.
+        # OPTIONS requests also call get_object(), outside any transaction, and are not locked.
+        if transaction.get_connection().in_atomic_block:
+            queryset = queryset.select_for_update()
+        return queryset
+
+    def update(self, request, *args, **kwargs):
+        # Hold the row locks from get_object() until the confirmation is saved
+        with transaction.atomic():
+            return super().update(request, *args, **kwargs)
 
 
 
@@ -174,6 +262,7 @@ class AdminVoucherListView(generics.ListAPIView):
     """Admin sees a list of all vouchers."""
     serializer_class = AdminVoucherListSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
+    pagination_class = EstimatedCountPagination
 
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["status", "category"]
@@ -181,17 +270,48 @@ class AdminVoucherListView(generics.ListAPIView):
     ordering_fields = ["created_at","initial_amount","remaining_balance"]
     ordering = ["-created_at"]
     
-    queryset = Voucher.objects.all()
+    # Redemptions are counted in the list query instead of one COUNT per voucher
+    queryset = Voucher.objects.select_related("customer").only(*VOUCHER_LIST_FIELDS).annotate(
+        redemptions_count=Count("redemptions"))
 
 
 class AdminVoucherDetailView(generics.RetrieveAPIView):
     """Admin views details of a voucher including all the redemptions tied to it."""
     serializer_class = AdminVoucherDetailSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    queryset = Voucher.objects.all()
+    queryset = voucher_detail_queryset()
     lookup_field = 'id'
 
 
+class AdminVoucherExportView(APIView):
+    """Admin downloads all vouchers as newline-delimited JSON, streamed in batches."""
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    # Vouchers read per query while streaming
+    batch_size = 2000
+
+    def get(self, request):
+        response = StreamingHttpResponse(self.export_rows(), content_type="application/x-ndjson")
+        response["Content-Disposition"] = 'attachment; filename="vouchers.ndjson"'
+        return response
+
+    def export_rows(self):
+        # Batches are keyed on the primary key so each query reads a bounded slice.
+        # iterator() would not help here: MySQL has no server-side cursors in Django.
+        vouchers = Voucher.objects.order_by("id").values(
+            "id", "code", "category", "initial_amount", "remaining_balance", "escrow_balance",
+            "status", "expiry_date", "created_at", customer_username=F("customer__username"),
+        )
+        last_id = 0
+        while True:
+            batch = list(vouchers.filter(id__gt=last_id)[:self.batch_size])
+            if not batch:
+                return
+            for row in batch:
+                yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+            last_id = batch[-1]["id"]
+
+
 
 # Customer only: Voucher simulation view
 class VoucherActivateSimulationView(APIView):
@@ -208,7 +328,7 @@ class VoucherActivateSimulationView(APIView):
     def post(self, request, voucher_id):
         # Fetch the voucher for the authenticated customer
         try:
-            voucher = Voucher.objects.get(id=voucher_id, customer=request.user)
+            voucher = Voucher.objects.only("id", "code", "status").get(id=voucher_id, customer=request.user)
         except Voucher.DoesNotExist:
             return Response(
                 {"detail": "Voucher not found or does not belong to you."},
@@ -222,9 +342,16 @@ class VoucherActivateSimulationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # payment simulation is successful and the voucher is activated
+        # payment simulation is successful and the voucher is activated.
+        # The UPDATE checks the status again, so a concurrent request cannot activate it twice.
+        activated = Voucher.objects.filter(pk=voucher.pk, status=Voucher.PENDING).update(
+            status=Voucher.ACTIVE, updated_at=timezone.now())
+        if not activated:
+            return Response(
+                {"detail": "Voucher cannot be activated. It was changed by another request."},
+                status=status.HTTP_409_CONFLICT
+            )
         voucher.status = Voucher.ACTIVE
-        voucher.save(update_fields=['status'])
 
         return Response(
             {
@@ -248,7 +375,20 @@ class ApprovedVendorsListView(generics.ListAPIView):
     # get the optional city and also filter by approved vendors
     def get(self, request, category):
         city = request.query_params.get('city', None)
+        vendors = self.approved_vendors(category, city)
+
+        # The list is the same for every user, so it is cached per category and city
+        # and version of the matching vendors, like the public vendor list
+        stamp = vendors.aggregate(last_updated=Max("updated_at"), total=Count("id"))
+        key = (f"vendor:approved:{quote(category)}:{quote((city or '').lower())}:"
+               f"{version_stamp(stamp['last_updated'])}:{stamp['total']}")
+        data = cache.get_or_set(key, lambda: list(vendors), settings.VENDOR_PUBLIC_CACHE_TIMEOUT)
+
+        # Paged like the other list endpoints, from the cached list
+        page = self.paginate_queryset(data)
+        return self.get_paginated_response(page)
 
+    def approved_vendors(self, category, city):
         vendors = VendorProfile.objects.filter(
             category=category,
             verification__status=VendorVerification.APPROVED
@@ -258,16 +398,7 @@ class ApprovedVendorsListView(generics.ListAPIView):
         if city:
             vendors = vendors.filter(city__iexact=city)
 
-        data = []
-        for vendor in vendors:
-            vendor_info = {
-                "business_name": vendor.business_name,
-                "city": vendor.city,
-                "gps_code": vendor.gps_code,
-                "category": vendor.category,
-                "phone_number": vendor.phone_number,
-            }
-            data.append(vendor_info)
-
-        return Response(data, status=status.HTTP_200_OK)
+        # Plain dicts straight from the cursor, no VendorProfile instances are built
+        return vendors.order_by("business_name", "id").values(
+            "business_name", "city", "gps_code", "category", "phone_number")
 